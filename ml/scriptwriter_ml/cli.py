@@ -5,13 +5,113 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import Any
+from dataclasses import asdict
+from typing import Any, BinaryIO, Iterable, Iterator
 
-from .models import describe_models
+from .models import describe_models_iter, model_ids
 from .transliteration import transliterate_tamil
-from .stt import transcribe_audio_file, transcribe_from_microphone
-from .tts import synthesize_to_file, speak_text
-from .llm import draft_scene, download_model, DEFAULT_LOCAL_MODELS
+from .deps import probe_once
+from .llm import DEFAULT_LOCAL_MODELS
+
+# orjson encodes straight to UTF-8 bytes, several times faster than stdlib json
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialise ``obj`` to compact UTF-8 JSON."""
+    if _HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _ENCODER.encode(obj).encode("utf-8")
+
+
+class _StreamList:
+    """Iterable payload that ``main`` serialises one item at a time."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self._items = items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+
+class _RawJSON(bytes):
+    """Already-encoded JSON that ``main`` writes through untouched."""
+
+    __slots__ = ()
+
+
+def _write_json(data: Any, out: BinaryIO) -> None:
+    """Encode ``data`` straight into ``out``, flushing after each streamed item."""
+
+    if isinstance(data, _RawJSON):
+        out.write(data)
+    elif isinstance(data, _StreamList):
+        out.write(b"[")
+        separator = b""
+        try:
+            for item in data:
+                # Encode before writing so a bad item never leaves half a record
+                encoded = _dumps(item)
+                out.write(separator + encoded)
+                out.flush()
+                separator = b","
+        except Exception as exc:
+            # Close the array with an error record so stdout stays valid JSON,
+            # then let the failure propagate to stderr and the exit status
+            out.write(separator + _dumps({"error": str(exc)}) + b"]")
+            raise
+        out.write(b"]")
+    elif isinstance(data, dict) and any(isinstance(value, _StreamList) for value in data.values()):
+        out.write(b"{")
+        try:
+            for index, (key, value) in enumerate(data.items()):
+                if index:
+                    out.write(b",")
+                out.write(_dumps(key) + b":")
+                _write_json(value, out)
+        finally:
+            out.write(b"}")
+    elif _HAVE_ORJSON:
+        out.write(_dumps(data))
+    else:
+        for chunk in _ENCODER.iterencode(data):
+            out.write(chunk.encode("utf-8"))
+
+
+def _write_ndjson(data: Any, out: BinaryIO) -> None:
+    """Write one JSON document per line, flushing after each record.
+
+    Lists, streams, and single-collection envelopes such as
+    ``{"models": [...]}`` are unwrapped into their items; anything else is
+    written as a single line.
+    """
+
+    if isinstance(data, dict) and len(data) == 1:
+        (value,) = data.values()
+        if isinstance(value, (list, _StreamList)):
+            data = value
+
+    if isinstance(data, (list, _StreamList)):
+        try:
+            for item in data:
+                out.write(_dumps(item) + b"\n")
+                out.flush()
+        except Exception as exc:
+            out.write(_dumps({"error": str(exc)}) + b"\n")
+            raise
+    elif isinstance(data, _RawJSON):
+        out.write(data + b"\n")
+    else:
+        out.write(_dumps(data) + b"\n")
 
 
 def _transliterate_command(args: argparse.Namespace) -> dict[str, Any]:
@@ -28,18 +128,37 @@ def _transliterate_command(args: argparse.Namespace) -> dict[str, Any]:
 
 def _transcribe_audio_command(args: argparse.Namespace) -> dict[str, Any]:
     """Transcribe an audio file to text."""
-    result = transcribe_audio_file(args.audio_file, language=args.language)
+    from .stt import transcribe_audio_file
+
+    result = transcribe_audio_file(args.audio_file, language=args.language, engine=args.engine)
     return result
 
 
 def _transcribe_mic_command(args: argparse.Namespace) -> dict[str, Any]:
     """Record from microphone and transcribe."""
+    from .stt import transcribe_from_microphone
+
     result = transcribe_from_microphone(duration=args.duration, language=args.language)
     return result
 
 
+def _transcribe_batch_command(args: argparse.Namespace) -> dict[str, Any]:
+    """Transcribe several audio files with a batched local model."""
+    from .stt import batch_transcribe
+
+    results = batch_transcribe(
+        args.audio_files,
+        model_id=args.model,
+        root=args.root,
+        batch_size=args.batch_size,
+    )
+    return {"results": _StreamList(results)}
+
+
 def _tts_command(args: argparse.Namespace) -> dict[str, Any]:
     """Convert text to speech."""
+    from .tts import synthesize_to_file, speak_text
+
     text = args.text
     if args.stdin or text is None:
         text = sys.stdin.read()
@@ -52,30 +171,58 @@ def _tts_command(args: argparse.Namespace) -> dict[str, Any]:
     return result
 
 
-def _llm_generate_command(args: argparse.Namespace) -> dict[str, Any]:
+def _write_delta(delta: str) -> None:
+    """Emit one NDJSON token event for ``llm-generate --stream``."""
+    sys.stdout.buffer.write(_dumps({"delta": delta}) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _llm_generate_command(args: argparse.Namespace) -> _RawJSON:
     """Generate scene using LLM."""
     prompt = args.prompt
     if args.stdin or prompt is None:
         prompt = sys.stdin.read()
     
+    # Neither backend can run, so skip importing the LLM stack at all
+    if not probe_once("urllib3") and not probe_once("llama_cpp"):
+        return _RawJSON(_dumps({
+            "prompt": prompt,
+            "response": "",
+            "model_id": "",
+            "success": False,
+            "error": "LLM generation failed: neither urllib3 nor llama-cpp-python is installed. Run: pip install -e .[llm]",
+        }))
+    
+    from .llm import draft_scene
+
     result = draft_scene(
         prompt=prompt,
         context=args.context or "",
         max_tokens=args.max_tokens,
         use_local=not args.no_local,
+        on_delta=_write_delta if args.stream else None,
+        n_ctx=args.n_ctx,
+        n_threads=args.n_threads,
+        n_gpu_layers=args.n_gpu_layers,
+        quant=args.quant,
     )
     
-    return {
-        "prompt": result.prompt,
-        "response": result.response,
-        "model_id": result.model_id,
-        "success": bool(result.response),
-        "error": result.error,
-    }
+    # Splice the encoded fields into a fixed envelope; the response can be
+    # long, so skip building an intermediate dict around it
+    return _RawJSON(b"".join((
+        b'{"prompt":', _dumps(result.prompt),
+        b',"response":', _dumps(result.response),
+        b',"model_id":', _dumps(result.model_id),
+        b',"success":', b"true" if result.response and result.error is None else b"false",
+        b',"error":', _dumps(result.error),
+        b"}",
+    )))
 
 
 def _llm_download_command(args: argparse.Namespace) -> dict[str, Any]:
     """Download a local LLM model."""
+    from .llm import download_model
+
     try:
         model_path = download_model(args.model, root=args.root)
         return {
@@ -93,12 +240,17 @@ def _llm_download_command(args: argparse.Namespace) -> dict[str, Any]:
 def _llm_list_command(args: argparse.Namespace) -> dict[str, Any]:
     """List available local models."""
     return {
-        "available_models": DEFAULT_LOCAL_MODELS,
+        "available_models": {name: asdict(model) for name, model in DEFAULT_LOCAL_MODELS.items()},
     }
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="scriptwriter-cli")
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write list results as newline-delimited JSON, one record per line",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Transliteration
@@ -116,6 +268,12 @@ def build_parser() -> argparse.ArgumentParser:
     stt_file = subparsers.add_parser("transcribe-file", help="Transcribe audio file to text")
     stt_file.add_argument("audio_file", help="Path to audio file (WAV, FLAC, etc.)")
     stt_file.add_argument("--language", default="en-IN", help="Language code (e.g., en-IN, ta-IN)")
+    stt_file.add_argument(
+        "--engine",
+        choices=["auto", "whisper", "google"],
+        default="auto",
+        help="Recognition engine (auto uses local Whisper when downloaded, else Google)",
+    )
     stt_file.set_defaults(func=_transcribe_audio_command)
 
     # Speech-to-Text from microphone
@@ -124,6 +282,19 @@ def build_parser() -> argparse.ArgumentParser:
     stt_mic.add_argument("--language", default="en-IN", help="Language code (e.g., en-IN, ta-IN)")
     stt_mic.set_defaults(func=_transcribe_mic_command)
 
+    # Speech-to-Text for many files
+    stt_batch = subparsers.add_parser("transcribe-batch", help="Transcribe audio files with a local Whisper model")
+    stt_batch.add_argument("audio_files", nargs="+", help="Paths to audio files")
+    stt_batch.add_argument(
+        "--model",
+        default="faster-whisper-base",
+        choices=model_ids("speech_to_text"),
+        help="Whisper model id",
+    )
+    stt_batch.add_argument("--root", help="Override model storage root")
+    stt_batch.add_argument("--batch-size", type=int, default=8, help="Audio chunks decoded per batch")
+    stt_batch.set_defaults(func=_transcribe_batch_command)
+
     # Text-to-Speech
     tts = subparsers.add_parser("tts", help="Convert text to speech")
     tts.add_argument("--text", help="Text to synthesize")
@@ -135,7 +306,7 @@ def build_parser() -> argparse.ArgumentParser:
     # Model inventory
     models = subparsers.add_parser("models", help="Inspect local model assets")
     models.add_argument("--root", help="Override model storage root")
-    models.set_defaults(func=lambda args: {"models": describe_models(root=args.root)})
+    models.set_defaults(func=lambda args: {"models": _StreamList(describe_models_iter(root=args.root))})
 
     # LLM: Generate scene
     llm_gen = subparsers.add_parser("llm-generate", help="Generate scene using LLM")
@@ -144,6 +315,19 @@ def build_parser() -> argparse.ArgumentParser:
     llm_gen.add_argument("--context", default="", help="Additional context for generation")
     llm_gen.add_argument("--max-tokens", type=int, default=1000, help="Maximum tokens to generate")
     llm_gen.add_argument("--no-local", action="store_true", help="Disable local model fallback")
+    llm_gen.add_argument("--n-ctx", type=int, default=4096, help="Local model context window")
+    llm_gen.add_argument("--n-threads", type=int, help="Local model CPU threads (default: min(8, CPU cores))")
+    llm_gen.add_argument(
+        "--n-gpu-layers",
+        type=int,
+        help="Layers to offload to the GPU, -1 for all (default: sized from free VRAM via NVML)",
+    )
+    llm_gen.add_argument("--quant", help="Prefer a local GGUF with this quantisation tag, e.g. q4_k_m")
+    llm_gen.add_argument(
+        "--stream",
+        action="store_true",
+        help="Emit NDJSON {\"delta\": ...} lines while generating, followed by the final result",
+    )
     llm_gen.set_defaults(func=_llm_generate_command)
 
     # LLM: Download model
@@ -163,7 +347,12 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
     data = args.func(args)
-    json.dump(data, sys.stdout, ensure_ascii=False)
+    sys.stdout.flush()
+    if args.ndjson:
+        _write_ndjson(data, sys.stdout.buffer)
+    else:
+        _write_json(data, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":  # pragma: no cover
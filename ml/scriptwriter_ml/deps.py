@@ -0,0 +1,41 @@
+"""Cached availability probes and lazy imports for optional dependencies."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+from functools import lru_cache
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def probe_once(name: str) -> bool:
+    """Return whether top-level module ``name`` is importable, without importing it.
+
+    The result is memoised for the life of the process, so each optional
+    dependency is searched for on ``sys.path`` at most once.
+    """
+    return importlib.util.find_spec(name) is not None
+
+
+@lru_cache(maxsize=None)
+def optional_import(module: str, attr: str | None = None) -> Any | None:
+    """Import ``module`` (and return its ``attr``) on first use, or None if unavailable.
+
+    Heavy optional backends are loaded through this so CLI commands that never
+    touch them start quickly. A missing package is detected with
+    ``probe_once`` before any import is attempted, and the outcome, including
+    a failed import, is memoised for the life of the process.
+    """
+    if not probe_once(module.partition(".")[0]):
+        _logger.debug("Optional dependency %s is not installed", module)
+        return None
+    try:
+        imported = importlib.import_module(module)
+        return getattr(imported, attr) if attr is not None else imported
+    except Exception as e:
+        _logger.debug("Could not import optional dependency %s: %s", module, e)
+        return None
@@ -2,39 +2,46 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import mmap
 import os
+import sys
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
 
+from .deps import optional_import, probe_once
 from .models import ensure_directories, locate_model
 
+if TYPE_CHECKING:
+    from llama_cpp import Llama
+
 _logger = logging.getLogger(__name__)
 
-# Try to import requests for API calls
+# Prefer orjson for request bodies and streamed chunks; fall back to stdlib json
 try:
-    import requests
-    _HAVE_REQUESTS = True
+    import orjson
+    _HAVE_ORJSON = True
 except ImportError:
-    _HAVE_REQUESTS = False
-    _logger.warning("requests not installed. Install with: pip install requests")
+    _HAVE_ORJSON = False
 
-# Try to import llama-cpp-python for local inference
-try:
-    from llama_cpp import Llama
-    _HAVE_LLAMA_CPP = True
-except ImportError:
-    _HAVE_LLAMA_CPP = False
-    _logger.info("llama-cpp-python not installed. Local LLM will be unavailable. Install with: pip install llama-cpp-python")
 
-# Try to import huggingface-hub for model downloads
-try:
-    from huggingface_hub import hf_hub_download
-    _HAVE_HF_HUB = True
-except ImportError:
-    _HAVE_HF_HUB = False
-    _logger.info("huggingface-hub not installed. Model downloads will be unavailable. Install with: pip install huggingface-hub")
+def _json_dumps(obj: Any) -> bytes:
+    """Serialise ``obj`` to UTF-8 JSON."""
+    if _HAVE_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document."""
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 @dataclass(slots=True)
@@ -45,33 +52,95 @@ class PromptResult:
     error: Optional[str] = None
 
 
+# Shared connection pool so the TLS connection to OpenRouter is reused across calls
+_POOL = None
+
+
+def _get_pool():
+    """Return the pooled OpenRouter connection manager, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        urllib3 = optional_import("urllib3")
+        _POOL = urllib3.PoolManager(
+            maxsize=8,
+            block=False,
+            retries=urllib3.Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=None,  # completions are POSTs; retry them too
+            ),
+        )
+    return _POOL
+
+
+SYSTEM_PROMPT = """You are a creative screenwriting assistant. Help write engaging scenes.
+Focus on natural dialogue, clear descriptions, character development, and pacing.
+Format in screenplay style."""
+
+# Loaded llama.cpp models keyed by (model_path, n_ctx, n_gpu_layers, n_threads).
+# A llama.cpp context is not thread-safe, so each model carries its own lock
+# that must be held for the whole of a completion, including stream consumption.
+_LLAMA_CACHE: dict[tuple, tuple["Llama", threading.Lock]] = {}
+_LLAMA_LOCK = threading.Lock()
+
+# Model directories already created during this process
+_ENSURED_DIRS: set[str] = set()
+
+# Weight files already handed to a prefetch thread
+_PREFETCHED: set[str] = set()
+
+
+@dataclass(frozen=True, slots=True)
+class LocalModel:
+    repo: str
+    filename: str
+    size_gb: float
+
+
 # Popular small models suitable for local inference
-DEFAULT_LOCAL_MODELS = {
+DEFAULT_LOCAL_MODELS: dict[str, LocalModel] = {
     # Tiny models (fast, good for testing)
-    "llama-3.2-1b": {
-        "repo": "bartowski/Llama-3.2-1B-Instruct-GGUF",
-        "filename": "Llama-3.2-1B-Instruct-Q4_K_M.gguf",
-        "size_gb": 0.8,
-    },
-    "qwen-1.5b": {
-        "repo": "Qwen/Qwen2.5-1.5B-Instruct-GGUF",
-        "filename": "qwen2.5-1.5b-instruct-q4_k_m.gguf",
-        "size_gb": 1.0,
-    },
+    "llama-3.2-1b": LocalModel(
+        repo="bartowski/Llama-3.2-1B-Instruct-GGUF",
+        filename="Llama-3.2-1B-Instruct-Q4_K_M.gguf",
+        size_gb=0.8,
+    ),
+    "qwen-1.5b": LocalModel(
+        repo="Qwen/Qwen2.5-1.5B-Instruct-GGUF",
+        filename="qwen2.5-1.5b-instruct-q4_k_m.gguf",
+        size_gb=1.0,
+    ),
     # Small models (balanced)
-    "llama-3.2-3b": {
-        "repo": "bartowski/Llama-3.2-3B-Instruct-GGUF",
-        "filename": "Llama-3.2-3B-Instruct-Q4_K_M.gguf",
-        "size_gb": 2.0,
-    },
-    "phi-3.5": {
-        "repo": "bartowski/Phi-3.5-mini-instruct-GGUF",
-        "filename": "Phi-3.5-mini-instruct-Q4_K_M.gguf",
-        "size_gb": 2.5,
-    },
+    "llama-3.2-3b": LocalModel(
+        repo="bartowski/Llama-3.2-3B-Instruct-GGUF",
+        filename="Llama-3.2-3B-Instruct-Q4_K_M.gguf",
+        size_gb=2.0,
+    ),
+    "phi-3.5": LocalModel(
+        repo="bartowski/Phi-3.5-mini-instruct-GGUF",
+        filename="Phi-3.5-mini-instruct-Q4_K_M.gguf",
+        size_gb=2.5,
+    ),
 }
 
 
+def _models_dir(root: str | Path | None) -> Path:
+    """Resolve the local model directory, creating it once per process."""
+    models_dir = Path(root) if root else Path.home() / ".cache" / "scriptwriter_ml" / "models"
+    key = str(models_dir)
+    if key not in _ENSURED_DIRS:
+        models_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+    return models_dir
+
+
+@lru_cache(maxsize=4)
+def _find_local_models(models_dir: str, mtime_ns: int) -> tuple[Path, ...]:
+    """List GGUF files in ``models_dir``; ``mtime_ns`` keys out stale listings."""
+    return tuple(sorted(Path(models_dir).glob("*.gguf")))
+
+
 def download_model(
     model_name: str = "llama-3.2-1b",
     root: str | Path | None = None,
@@ -90,40 +159,44 @@ def download_model(
         ValueError: If model_name not recognized
         ImportError: If huggingface-hub not installed
     """
-    if not _HAVE_HF_HUB:
+    hf_hub_download = optional_import("huggingface_hub", "hf_hub_download")
+    if hf_hub_download is None:
         raise ImportError("huggingface-hub required for model downloads. Install with: pip install huggingface-hub")
     
-    if model_name not in DEFAULT_LOCAL_MODELS:
+    model_info = DEFAULT_LOCAL_MODELS.get(model_name)
+    if model_info is None:
         raise ValueError(f"Unknown model: {model_name}. Choose from: {list(DEFAULT_LOCAL_MODELS.keys())}")
     
-    model_info = DEFAULT_LOCAL_MODELS[model_name]
-    
     # Ensure models directory exists
-    models_dir = Path(root) if root else Path.home() / ".cache" / "scriptwriter_ml" / "models"
-    models_dir.mkdir(parents=True, exist_ok=True)
+    models_dir = _models_dir(root)
     
-    model_path = models_dir / model_info["filename"]
+    model_path = models_dir / model_info.filename
     
     if model_path.exists():
         _logger.info(f"Model already downloaded: {model_path}")
+        _prefetch_weights(model_path)
         return model_path
     
-    _logger.info(f"Downloading {model_name} (~{model_info['size_gb']:.1f} GB)...")
-    _logger.info(f"From: {model_info['repo']}")
+    _logger.info(f"Downloading {model_name} (~{model_info.size_gb:.1f} GB)...")
+    _logger.info(f"From: {model_info.repo}")
     
     try:
         downloaded_path = hf_hub_download(
-            repo_id=model_info["repo"],
-            filename=model_info["filename"],
+            repo_id=model_info.repo,
+            filename=model_info.filename,
             cache_dir=models_dir.parent,
             resume_download=True,
         )
         
-        # Create symlink for easier access
-        if not model_path.exists():
-            model_path.symlink_to(downloaded_path)
+        # Create symlink for easier access; a concurrent download may have won the race
+        if Path(downloaded_path) != model_path:
+            try:
+                os.symlink(downloaded_path, model_path)
+            except FileExistsError:
+                pass
         
         _logger.info(f"Model downloaded: {model_path}")
+        _prefetch_weights(Path(downloaded_path))
         return Path(downloaded_path)
         
     except Exception as e:
@@ -131,14 +204,203 @@ def download_model(
         raise
 
 
+def _advise_willneed(path: Path) -> None:
+    """Ask the kernel to read ``path`` into the page cache ahead of use."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError as e:
+        _logger.debug(f"Cannot open {path} for prefetch: {e}")
+        return
+
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        elif hasattr(mmap, "MADV_WILLNEED"):
+            # macOS has no posix_fadvise; madvise on a read-only mapping starts readahead
+            size = os.fstat(fd).st_size
+            if size:
+                with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+                    mapped.madvise(mmap.MADV_WILLNEED)
+    except (OSError, ValueError) as e:
+        _logger.debug(f"Prefetch of {path} failed: {e}")
+    finally:
+        os.close(fd)
+
+
+def _prefetch_weights(model_path: Path) -> None:
+    """Start paging model weights in on a daemon thread, once per file."""
+    key = str(model_path)
+    if key in _PREFETCHED:
+        return
+    _PREFETCHED.add(key)
+    threading.Thread(
+        target=_advise_willneed,
+        args=(model_path,),
+        name="scriptwriter-prefetch",
+        daemon=True,
+    ).start()
+
+
+def _auto_n_threads() -> int:
+    """Pick a llama.cpp thread count from the available CPU cores."""
+    return min(8, os.cpu_count() or 4)
+
+
+# Byte sizes of fixed-width GGUF metadata value types (see the GGUF spec)
+_GGUF_SCALAR_SIZES = {0: 1, 1: 1, 2: 2, 3: 2, 4: 4, 5: 4, 6: 4, 7: 1, 10: 8, 11: 8, 12: 8}
+_GGUF_STRING = 8
+_GGUF_ARRAY = 9
+
+
+@lru_cache(maxsize=8)
+def _gguf_block_count(model_path: str) -> Optional[int]:
+    """Read the transformer layer count (``<arch>.block_count``) from a GGUF header.
+
+    Returns None if the file is not GGUF v2+ or has no block count.
+    """
+
+    def read(f, size: int) -> bytes:
+        data = f.read(size)
+        if len(data) != size:
+            raise EOFError("truncated GGUF header")
+        return data
+
+    def read_u32(f) -> int:
+        return int.from_bytes(read(f, 4), "little")
+
+    def read_u64(f) -> int:
+        return int.from_bytes(read(f, 8), "little")
+
+    def skip_value(f, value_type: int) -> None:
+        if value_type == _GGUF_STRING:
+            f.seek(read_u64(f), os.SEEK_CUR)
+        elif value_type == _GGUF_ARRAY:
+            item_type = read_u32(f)
+            count = read_u64(f)
+            if item_type in _GGUF_SCALAR_SIZES:
+                f.seek(_GGUF_SCALAR_SIZES[item_type] * count, os.SEEK_CUR)
+            else:
+                for _ in range(count):
+                    skip_value(f, item_type)
+        else:
+            f.seek(_GGUF_SCALAR_SIZES[value_type], os.SEEK_CUR)
+
+    try:
+        with open(model_path, "rb") as f:
+            if read(f, 4) != b"GGUF" or read_u32(f) < 2:
+                return None
+            read_u64(f)  # tensor count
+            for _ in range(read_u64(f)):
+                key = read(f, read_u64(f)).decode("utf-8", "replace")
+                value_type = read_u32(f)
+                if key.endswith(".block_count") and value_type in (4, 5, 10, 11):
+                    size = _GGUF_SCALAR_SIZES[value_type]
+                    return int.from_bytes(read(f, size), "little", signed=value_type in (5, 11))
+                skip_value(f, value_type)
+    except (OSError, EOFError, KeyError) as e:
+        _logger.debug(f"Could not read GGUF metadata from {model_path}: {e}")
+    return None
+
+
+def _cuda_free_bytes() -> Optional[int]:
+    """Return free memory on the first NVIDIA GPU, or None if it cannot be read.
+
+    NVML reads the driver's counters directly, so unlike a CUDA runtime query
+    it creates no context that would hold VRAM for the rest of the process.
+    """
+    pynvml = optional_import("pynvml")
+    if pynvml is None:
+        return None
+    try:
+        pynvml.nvmlInit()
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            return int(pynvml.nvmlDeviceGetMemoryInfo(handle).free)
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception as e:
+        _logger.debug(f"Could not query GPU memory: {e}")
+        return None
+
+
+@lru_cache(maxsize=8)
+def _auto_n_gpu_layers(model_path: str) -> int:
+    """Offload as many layers as fit in free CUDA memory (-1 = all layers).
+
+    Metal shares system memory, and without NVML we cannot measure VRAM, so
+    both cases keep llama.cpp's default of offloading everything.
+    """
+    if sys.platform == "darwin":
+        return -1
+    free_bytes = _cuda_free_bytes()
+    if free_bytes is None:
+        return -1
+
+    # Leave ~20% headroom for the KV cache and scratch buffers
+    model_bytes = os.path.getsize(model_path) * 1.2
+    if free_bytes >= model_bytes:
+        return -1
+    block_count = _gguf_block_count(model_path)
+    if not block_count:
+        _logger.info("Unknown layer count; keeping the model on the CPU")
+        return 0
+    # free_bytes < model_bytes, so this always stays below block_count
+    layers = int(free_bytes // (model_bytes / block_count))
+    _logger.info(f"Offloading {layers} layers to GPU ({free_bytes / 2**30:.1f} GiB free)")
+    return layers
+
+
+def _get_llama(
+    model_path: Path,
+    n_ctx: int = 4096,
+    n_gpu_layers: int = -1,
+    n_threads: int = 4,
+) -> tuple["Llama", threading.Lock]:
+    """Return a shared llama.cpp instance and its lock, loading the weights on first use."""
+    key = (str(model_path), n_ctx, n_gpu_layers, n_threads)
+    entry = _LLAMA_CACHE.get(key)
+    if entry is not None:
+        return entry
+
+    with _LLAMA_LOCK:
+        entry = _LLAMA_CACHE.get(key)
+        if entry is None:
+            _logger.info(f"Loading local model: {model_path.name}")
+            # Use Metal on macOS, CUDA on Linux/Windows if available
+            Llama = optional_import("llama_cpp", "Llama")
+            if Llama is None:
+                raise ImportError("llama-cpp-python not installed")
+            llm = Llama(
+                model_path=str(model_path),
+                n_ctx=n_ctx,  # Context window
+                n_threads=n_threads,  # CPU threads
+                n_gpu_layers=n_gpu_layers,  # Use GPU if available (-1 = all layers)
+                verbose=False,
+            )
+            entry = (llm, threading.Lock())
+            _LLAMA_CACHE[key] = entry
+            if hasattr(llm, "close"):
+                atexit.register(llm.close)
+    return entry
+
+
 def _draft_scene_local(
     prompt: str,
     context: str,
     model_path: Path,
     max_tokens: int = 1000,
+    on_delta: Optional[Callable[[str], None]] = None,
+    n_ctx: int = 4096,
+    n_threads: Optional[int] = None,
+    n_gpu_layers: Optional[int] = None,
 ) -> PromptResult:
-    """Generate scene using local llama.cpp model."""
-    if not _HAVE_LLAMA_CPP:
+    """Generate scene using local llama.cpp model.
+
+    Tokens are streamed from llama.cpp; ``on_delta`` receives each text
+    fragment as soon as it is decoded. ``n_threads`` and ``n_gpu_layers``
+    are sized from the host when left as None.
+    """
+    if optional_import("llama_cpp", "Llama") is None:
         return PromptResult(
             prompt=prompt,
             response="",
@@ -147,42 +409,46 @@ def _draft_scene_local(
         )
     
     try:
-        _logger.info(f"Loading local model: {model_path.name}")
-        
-        # Initialize llama.cpp model
-        # Use Metal on macOS, CUDA on Linux/Windows if available
-        llm = Llama(
-            model_path=str(model_path),
-            n_ctx=4096,  # Context window
-            n_threads=4,  # CPU threads
-            n_gpu_layers=-1,  # Use GPU if available (-1 = all layers)
-            verbose=False,
+        # Reuse the loaded model without resetting it; llama.cpp keeps the KV
+        # cache for the longest shared prefix, so the system prompt from the
+        # previous chat is not evaluated again
+        llm, llm_lock = _get_llama(
+            model_path,
+            n_ctx=n_ctx,
+            n_gpu_layers=n_gpu_layers if n_gpu_layers is not None else _auto_n_gpu_layers(str(model_path)),
+            n_threads=n_threads or _auto_n_threads(),
         )
         
-        system_prompt = """You are a creative screenwriting assistant. Help write engaging scenes.
-Focus on natural dialogue, clear descriptions, character development, and pacing.
-Format in screenplay style."""
-        
         user_message = f"Context:\n{context}\n\nPrompt:\n{prompt}" if context else prompt
         
         # Build chat messages
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": user_message}
         ]
         
         _logger.info(f"Generating scene (max_tokens={max_tokens})...")
         
-        # Generate response
-        response = llm.create_chat_completion(
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=0.7,
-            top_p=0.9,
-            stop=["</scene>", "\n\nEND"],
-        )
-        
-        generated_text = response["choices"][0]["message"]["content"]
+        # Generate response token by token; the stream decodes lazily, so the
+        # model stays locked until it is exhausted
+        pieces: list[str] = []
+        with llm_lock:
+            stream = llm.create_chat_completion(
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                top_p=0.9,
+                stop=["</scene>", "\n\nEND"],
+                stream=True,
+            )
+            for chunk in stream:
+                delta = chunk["choices"][0]["delta"].get("content")
+                if not delta:
+                    continue
+                pieces.append(delta)
+                if on_delta is not None:
+                    on_delta(delta)
+        generated_text = "".join(pieces)
         
         _logger.info(f"Generated {len(generated_text)} characters")
         
@@ -210,6 +476,11 @@ def draft_scene(
     context: str = "",
     max_tokens: int = 1000,
     use_local: bool = True,  # NEW: Enable local fallback by default
+    on_delta: Optional[Callable[[str], None]] = None,
+    n_ctx: int = 4096,
+    n_threads: Optional[int] = None,
+    n_gpu_layers: Optional[int] = None,
+    quant: Optional[str] = None,
 ) -> PromptResult:
     """
     Generate a scene using LLM with smart fallback:
@@ -225,34 +496,55 @@ def draft_scene(
         context: Additional context for generation
         max_tokens: Maximum tokens to generate
         use_local: Enable local model fallback
+        on_delta: Optional callback invoked with each generated text fragment
+        n_ctx: Local model context window
+        n_threads: Local CPU threads (default: min(8, cpu_count))
+        n_gpu_layers: Layers offloaded to the GPU (default: sized from free VRAM)
+        quant: Prefer a local GGUF whose filename contains this tag (e.g. "q4_k_m")
     
     Returns:
-        PromptResult with generated text or error
+        PromptResult with generated text or error. If a streamed API response
+        fails after ``on_delta`` has received text, the partial text is
+        returned with the error and no local fallback is attempted.
     """
+    # Look for a downloaded local model up front so its weights can be paged
+    # in while the cloud request is in flight
+    local_model: Optional[Path] = None
+    if use_local and probe_once("llama_cpp"):
+        models_dir = _models_dir(root)
+        
+        # Find any existing .gguf models; the directory mtime changes whenever
+        # a model is added or removed, which invalidates the cached listing
+        existing_models = _find_local_models(str(models_dir), models_dir.stat().st_mtime_ns)
+        if quant:
+            tag = quant.lower()
+            existing_models = tuple(path for path in existing_models if tag in path.name.lower()) or existing_models
+        if existing_models:
+            local_model = existing_models[0]
+            _prefetch_weights(local_model)
+    
     # Try cloud API first if we have an API key
-    if _HAVE_REQUESTS and (api_key or os.getenv("OPENROUTER_API_KEY")):
+    if optional_import("urllib3") is not None and (api_key or os.getenv("OPENROUTER_API_KEY")):
         _logger.info("Trying OpenRouter API...")
-        result = _draft_scene_api(prompt, model_id, api_key, context, max_tokens)
-        if result.response:
+        result = _draft_scene_api(prompt, model_id, api_key, context, max_tokens, on_delta)
+        if result.error is None and result.response:
+            return result
+        if result.response and on_delta is not None:
+            # Part of the cloud answer has already been streamed to the caller;
+            # appending a different local answer would splice two responses
+            _logger.warning(f"API stream failed after partial output: {result.error}")
             return result
         _logger.warning(f"API failed: {result.error}")
     
     # Fall back to local model if enabled
-    if use_local and _HAVE_LLAMA_CPP:
+    if use_local and probe_once("llama_cpp"):
         _logger.info("Falling back to local LLM...")
         
         # Determine which local model to use
         local_model_name = "llama-3.2-1b"  # Default to smallest/fastest
         
-        # Check if a local model is already downloaded
-        models_dir = Path(root) if root else Path.home() / ".cache" / "scriptwriter_ml" / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Find any existing .gguf models
-        existing_models = list(models_dir.glob("*.gguf"))
-        
-        if existing_models:
-            model_path = existing_models[0]
+        if local_model is not None:
+            model_path = local_model
             _logger.info(f"Using existing model: {model_path.name}")
         else:
             # Try to download default model
@@ -269,17 +561,26 @@ def draft_scene(
                 )
         
         # Generate with local model
-        return _draft_scene_local(prompt, context, model_path, max_tokens)
+        return _draft_scene_local(
+            prompt,
+            context,
+            model_path,
+            max_tokens,
+            on_delta,
+            n_ctx=n_ctx,
+            n_threads=n_threads,
+            n_gpu_layers=n_gpu_layers,
+        )
     
     # No options available
     error_msg = []
-    if not _HAVE_REQUESTS:
-        error_msg.append("requests library not installed")
+    if optional_import("urllib3") is None:
+        error_msg.append("urllib3 library not installed")
     if not api_key and not os.getenv("OPENROUTER_API_KEY"):
         error_msg.append("no API key provided")
     if not use_local:
         error_msg.append("local model disabled")
-    elif not _HAVE_LLAMA_CPP:
+    elif optional_import("llama_cpp", "Llama") is None:
         error_msg.append("llama-cpp-python not installed")
     
     return PromptResult(
@@ -290,14 +591,47 @@ def draft_scene(
     )
 
 
+def _sse_deltas(lines: Iterable[bytes]) -> Iterator[str]:
+    """Yield the text fragments of a streamed chat completion.
+
+    ``lines`` are the raw lines of an OpenAI-compatible Server-Sent Events
+    body. Chunks without choices (such as a trailing usage report) are
+    skipped; an error chunk raises RuntimeError.
+    """
+    for raw_line in lines:
+        line = raw_line.decode("utf-8").rstrip("\r\n")
+        # Skip keep-alives and SSE comments such as ": OPENROUTER PROCESSING"
+        if not line.startswith("data: "):
+            continue
+        payload = line[len("data: "):]
+        if payload == "[DONE]":
+            return
+        chunk = _json_loads(payload)
+        if "error" in chunk:
+            error = chunk["error"]
+            if isinstance(error, dict):
+                error = error.get("message", error)
+            raise RuntimeError(str(error))
+        if not chunk.get("choices"):
+            continue
+        delta = chunk["choices"][0].get("delta", {}).get("content")
+        if delta:
+            yield delta
+
+
 def _draft_scene_api(
     prompt: str,
     model: str,
     api_key: Optional[str],
     context: str,
     max_tokens: int,
+    on_delta: Optional[Callable[[str], None]] = None,
 ) -> PromptResult:
-    """Generate scene using OpenRouter API."""
+    """Generate scene using OpenRouter API.
+
+    The completion is requested as Server-Sent Events and ``on_delta``
+    receives each text fragment as it arrives.
+    """
     key = api_key or os.getenv("OPENROUTER_API_KEY")
     if not key:
         return PromptResult(
@@ -307,34 +641,41 @@ def _draft_scene_api(
             error="No API key. Set OPENROUTER_API_KEY environment variable."
         )
     
-    system_prompt = """You are a creative screenwriting assistant. Help write engaging scenes.
-Focus on natural dialogue, clear descriptions, character development, and pacing.
-Format in screenplay style."""
-    
     user_message = f"Context:\n{context}\n\nPrompt:\n{prompt}" if context else prompt
     
+    pieces: list[str] = []
     try:
-        response = requests.post(
+        response = _get_pool().request(
+            "POST",
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {key}",
                 "Content-Type": "application/json",
             },
-            json={
+            body=_json_dumps({
                 "model": model,
                 "messages": [
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": user_message}
                 ],
                 "max_tokens": max_tokens,
                 "temperature": 0.7,
-            },
+                "stream": True,
+            }),
             timeout=30,
+            preload_content=False,
         )
         
-        response.raise_for_status()
-        data = response.json()
-        generated_text = data["choices"][0]["message"]["content"]
+        try:
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP {response.status}: {response.data.decode('utf-8', 'replace')}")
+            for delta in _sse_deltas(response):
+                pieces.append(delta)
+                if on_delta is not None:
+                    on_delta(delta)
+        finally:
+            response.release_conn()
+        generated_text = "".join(pieces)
         
         return PromptResult(
             prompt=prompt,
@@ -344,9 +685,11 @@ Format in screenplay style."""
         
     except Exception as e:
         _logger.error(f"LLM API error: {e}")
+        # Keep any text received before the failure; it may already have been
+        # passed to on_delta
         return PromptResult(
             prompt=prompt,
-            response="",
+            response="".join(pieces),
             model_id=model,
             error=str(e)
         )
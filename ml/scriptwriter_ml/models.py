@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ModelSpec:
     identifier: str
     model_type: str
@@ -19,7 +20,7 @@ class ModelSpec:
     requires_gpu: bool = False
 
 
-MODEL_REGISTRY: list[ModelSpec] = [
+MODEL_REGISTRY: tuple[ModelSpec, ...] = (
     ModelSpec(
         identifier="faster-whisper-base",
         model_type="speech_to_text",
@@ -79,7 +80,9 @@ MODEL_REGISTRY: list[ModelSpec] = [
         filename="ibm-granite-7b-slim.gguf",
         supports_mlx=True,
     ),
-]
+)
+
+_MODEL_BY_ID: dict[str, ModelSpec] = {spec.identifier: spec for spec in MODEL_REGISTRY}
 
 
 def _resolve_root(root: str | Path | None) -> Path:
@@ -91,30 +94,65 @@ def _resolve_root(root: str | Path | None) -> Path:
     return root
 
 
-def describe_models(root: str | Path | None = None) -> list[dict]:
+def _scan_model_files(base: Path) -> dict[str, set[str]]:
+    """Map each registered model folder under ``base`` to the entries it holds.
+
+    One directory read per folder replaces a stat per registry entry.
+    Entries are kept only if they resolve, matching ``Path.exists``.
+    """
+    present: dict[str, set[str]] = {}
+    with os.scandir(base) as folders:
+        for folder in folders:
+            if folder.name not in _MODEL_BY_ID or not folder.is_dir():
+                continue
+            with os.scandir(folder.path) as entries:
+                present[folder.name] = {
+                    entry.name for entry in entries if entry.is_file() or entry.is_dir()
+                }
+    return present
+
+
+def describe_models_iter(root: str | Path | None = None) -> Iterator[dict]:
+    """Yield one status record per registered model as each is inspected."""
+
     base = _resolve_root(root)
-    records: list[dict] = []
+    present = _scan_model_files(base)
     for spec in MODEL_REGISTRY:
-        candidate = base / spec.identifier / spec.filename
-        records.append(
-            {
-                **asdict(spec),
-                "path": str(candidate) if candidate.exists() else None,
-                "downloaded": candidate.exists(),
-                "folder": str((base / spec.identifier)),
-            }
-        )
-    return records
+        folder = base / spec.identifier
+        candidate = folder / spec.filename
+        exists = spec.filename in present.get(spec.identifier, ())
+        yield {
+            "identifier": spec.identifier,
+            "model_type": spec.model_type,
+            "title": spec.title,
+            "provider": spec.provider,
+            "size_mb": spec.size_mb,
+            "filename": spec.filename,
+            "supports_mlx": spec.supports_mlx,
+            "requires_gpu": spec.requires_gpu,
+            "path": str(candidate) if exists else None,
+            "downloaded": exists,
+            "folder": str(folder),
+        }
+
+
+def describe_models(root: str | Path | None = None) -> list[dict]:
+    return list(describe_models_iter(root))
 
 
 def locate_model(identifier: str, root: str | Path | None = None) -> Path:
     base = _resolve_root(root)
-    spec = next((spec for spec in MODEL_REGISTRY if spec.identifier == identifier), None)
+    spec = _MODEL_BY_ID.get(identifier)
     if spec is None:
         raise KeyError(f"Unknown model id: {identifier}")
     return base / spec.identifier / spec.filename
 
 
+def model_ids(model_type: str) -> tuple[str, ...]:
+    """Return the registered identifiers of one model type, in registry order."""
+    return tuple(spec.identifier for spec in MODEL_REGISTRY if spec.model_type == model_type)
+
+
 def ensure_directories(root: str | Path | None = None, identifiers: Iterable[str] | None = None) -> None:
     base = _resolve_root(root)
     for spec in MODEL_REGISTRY:
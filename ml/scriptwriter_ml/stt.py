@@ -3,20 +3,30 @@
 from __future__ import annotations
 
 import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from .models import ensure_directories, locate_model
+from .deps import optional_import, probe_once
+from .models import ensure_directories, locate_model, model_ids
+
+if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 _logger = logging.getLogger(__name__)
 
-# Try to import speech recognition library
-try:
-    import speech_recognition as sr
-    _HAVE_SR = True
-except ImportError:
-    _HAVE_SR = False
-    _logger.warning("speech_recognition not installed. Install with: pip install SpeechRecognition")
+# Small fixed pool: file decoding, Whisper inference and web recognition all release the GIL,
+# so a few workers overlap one file's I/O with another's compute or network wait
+_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="scriptwriter-stt")
+
+# Registry ids that name Faster-Whisper checkpoints
+_WHISPER_MODEL_IDS = model_ids("speech_to_text")
+
+# Loaded Whisper models keyed by (model_id, model folder)
+_WHISPER_CACHE: dict[tuple, "WhisperModel"] = {}
+_WHISPER_LOCK = threading.Lock()
 
 
 def warmup(model_id: str, root: str | Path | None = None) -> None:
@@ -27,18 +37,143 @@ def warmup(model_id: str, root: str | Path | None = None) -> None:
     # Actual loading is performed lazily by the runtime (mlx-whisper/faster-whisper).
 
 
-def transcribe_audio_file(audio_path: str, language: str = "en-IN") -> dict:
+def _get_whisper_model(
+    model_id: str = "faster-whisper-base",
+    root: str | Path | None = None,
+    local_files_only: bool = False,
+) -> "WhisperModel":
+    """Return a shared int8 Faster-Whisper model, loading it on first use.
+
+    With ``local_files_only`` the load fails instead of downloading weights.
+    Raises ValueError if ``model_id`` is not a speech-to-text model.
     """
-    Transcribe an audio file to text using speech_recognition library.
+    if model_id not in _WHISPER_MODEL_IDS:
+        raise ValueError(f"Not a speech-to-text model: {model_id}")
+    folder = locate_model(model_id, root=root).parent
+    key = (model_id, str(folder))
+    model = _WHISPER_CACHE.get(key)
+    if model is not None:
+        return model
+
+    with _WHISPER_LOCK:
+        model = _WHISPER_CACHE.get(key)
+        if model is None:
+            # "faster-whisper-base" -> "base"; weights are fetched into the model folder
+            size = model_id.removeprefix("faster-whisper-")
+            _logger.info(f"Loading Whisper model: {size}")
+            model = optional_import("faster_whisper").WhisperModel(
+                size,
+                device="auto",
+                compute_type="int8",
+                download_root=str(folder),
+                local_files_only=local_files_only,
+            )
+            _WHISPER_CACHE[key] = model
+    return model
+
+
+def _whisper_weights_present(model_id: str, root: str | Path | None = None) -> bool:
+    """Return whether Faster-Whisper weights for ``model_id`` are already downloaded.
+
+    Checks the Hugging Face cache layout faster-whisper uses under the model
+    folder, so the answer costs a directory lookup rather than importing
+    faster-whisper (and with it ctranslate2 and PyAV).
+    """
+    folder = locate_model(model_id, root=root).parent
+    size = model_id.removeprefix("faster-whisper-")
+    return any(folder.glob(f"models--Systran--faster-whisper-{size}/snapshots/*/model.bin"))
+
+
+def _get_whisper_pipeline(model_id: str, root: str | Path | None = None) -> "BatchedInferencePipeline":
+    """Wrap the shared Whisper model in a batched inference pipeline."""
+    model = _get_whisper_model(model_id, root=root)
+    return optional_import("faster_whisper").BatchedInferencePipeline(model=model)
+
+
+def _transcribe_whisper(audio_path: str, language: str, model: "WhisperModel") -> dict:
+    """Transcribe with a local Faster-Whisper model."""
+    try:
+        # Whisper takes bare ISO codes: 'ta-IN' -> 'ta'
+        segments, _info = model.transcribe(
+            audio_path,
+            language=language.split("-")[0] or None,
+            beam_size=1,
+            vad_filter=True,
+        )
+        segments = list(segments)
+        text = " ".join(segment.text.strip() for segment in segments)
+        if not text:
+            return {
+                "text": "",
+                "confidence": 0.0,
+                "error": "Could not understand audio"
+            }
+        confidence = sum(math.exp(segment.avg_logprob) for segment in segments) / len(segments)
+        return {
+            "text": text,
+            "confidence": round(confidence, 3),
+            "engine": "faster-whisper"
+        }
+    except Exception as e:
+        _logger.error(f"Whisper transcription error: {e}")
+        return {
+            "text": "",
+            "confidence": 0.0,
+            "error": str(e)
+        }
+
+
+def transcribe_audio_file(
+    audio_path: str,
+    language: str = "en-IN",
+    engine: str = "auto",
+    model_id: str = "faster-whisper-base",
+    root: str | Path | None = None,
+) -> dict:
+    """
+    Transcribe an audio file to text.
     
     Args:
         audio_path: Path to audio file (WAV, FLAC, etc.)
         language: Language code (e.g., 'en-IN', 'ta-IN')
+        engine: 'whisper' for local Faster-Whisper (downloads weights if needed),
+            'google' for speech_recognition's web API, or 'auto' to use Whisper
+            when its weights are already on disk and Google otherwise
+        model_id: Whisper model identifier from the model registry
+        root: Root directory for local models
     
     Returns:
         Dictionary with 'text', 'confidence', and optional 'error' keys
     """
-    if not _HAVE_SR:
+    if engine == "whisper" and not probe_once("faster_whisper"):
+        return {
+            "text": "",
+            "confidence": 0.0,
+            "error": "faster-whisper not installed. Run: pip install faster-whisper"
+        }
+    
+    # "auto" only pays for importing faster-whisper once the weights are on disk
+    if engine == "whisper" or (
+        engine == "auto"
+        and probe_once("faster_whisper")
+        and _whisper_weights_present(model_id, root=root)
+    ):
+        try:
+            model = _get_whisper_model(model_id, root=root, local_files_only=engine == "auto")
+        except Exception as e:
+            if engine == "whisper":
+                _logger.error(f"Failed to load Whisper model: {e}")
+                return {
+                    "text": "",
+                    "confidence": 0.0,
+                    "error": str(e)
+                }
+            _logger.info(f"Whisper model unavailable, using Google: {e}")
+        else:
+            return _transcribe_whisper(audio_path, language, model)
+    
+    sr = optional_import("speech_recognition")
+    if sr is None:
         return {
             "text": "",
             "confidence": 0.0,
@@ -82,6 +217,31 @@ def transcribe_audio_file(audio_path: str, language: str = "en-IN") -> dict:
         }
 
 
+def transcribe_audio_files(
+    audio_paths: Iterable[str],
+    language: str = "en-IN",
+    engine: str = "auto",
+) -> Iterator[dict]:
+    """
+    Transcribe several audio files concurrently.
+    
+    Args:
+        audio_paths: Paths to audio files (WAV, FLAC, etc.)
+        language: Language code (e.g., 'en-IN', 'ta-IN')
+        engine: Recognition engine, as for ``transcribe_audio_file``
+    
+    Yields:
+        Result dictionaries from ``transcribe_audio_file`` with an added
+        'file' key, in completion order
+    """
+    futures = {
+        _EXECUTOR.submit(transcribe_audio_file, str(path), language, engine): str(path)
+        for path in audio_paths
+    }
+    for future in as_completed(futures):
+        yield {"file": futures[future], **future.result()}
+
+
 def transcribe_from_microphone(duration: int = 5, language: str = "en-IN") -> dict:
     """
     Record from microphone and transcribe in real-time.
@@ -93,7 +253,8 @@ def transcribe_from_microphone(duration: int = 5, language: str = "en-IN") -> di
     Returns:
         Dictionary with transcription result
     """
-    if not _HAVE_SR:
+    sr = optional_import("speech_recognition")
+    if sr is None:
         return {
             "text": "",
             "success": False,
@@ -159,20 +320,70 @@ def batch_transcribe(
     audio_files: Iterable[Path],
     model_id: str = "faster-whisper-base",
     root: str | Path | None = None,
-) -> list[dict]:
-    """Placeholder batching implementation.
+    batch_size: int = 8,
+) -> Iterator[dict]:
+    """Transcribe several files with Faster-Whisper's batched pipeline.
 
-    Integrate Faster-Whisper or MLX here once models are downloaded. We return
-    structured metadata so the Tauri layer can display progress.
+    Each file's audio chunks are decoded in batches of ``batch_size`` so the
+    accelerator stays busy. Results are yielded per file, letting the CLI
+    stream progress to the Tauri layer.
+
+    The model id is validated and the pipeline loaded before the iterator is
+    returned, so an unknown or non-Whisper model raises here rather than
+    mid-stream. If loading fails, every file gets an error record instead.
     """
 
+    if model_id not in _WHISPER_MODEL_IDS:
+        raise ValueError(f"Not a speech-to-text model: {model_id}")
     warmup(model_id, root=root)
-    return [
-        {
-            "file": str(path),
-            "text": "",
-            "language": "ta",
-            "segments": [],
-        }
-        for path in audio_files
-    ]
+
+    pipeline = None
+    load_error = "faster-whisper not installed. Run: pip install faster-whisper"
+    if optional_import("faster_whisper") is not None:
+        try:
+            pipeline = _get_whisper_pipeline(model_id, root=root)
+        except Exception as e:
+            _logger.error(f"Failed to load Whisper model {model_id}: {e}")
+            load_error = str(e)
+
+    return _batch_results(audio_files, pipeline, load_error, batch_size)
+
+
+def _batch_results(
+    audio_files: Iterable[Path],
+    pipeline: "BatchedInferencePipeline | None",
+    load_error: str,
+    batch_size: int,
+) -> Iterator[dict]:
+    for path in audio_files:
+        if pipeline is None:
+            yield {
+                "file": str(path),
+                "text": "",
+                "language": "ta",
+                "segments": [],
+                "error": load_error,
+            }
+            continue
+
+        try:
+            segments, info = pipeline.transcribe(str(path), batch_size=batch_size)
+            records = [
+                {"start": segment.start, "end": segment.end, "text": segment.text.strip()}
+                for segment in segments
+            ]
+            yield {
+                "file": str(path),
+                "text": " ".join(record["text"] for record in records),
+                "language": info.language,
+                "segments": records,
+            }
+        except Exception as e:
+            _logger.error(f"Batch transcription error for {path}: {e}")
+            yield {
+                "file": str(path),
+                "text": "",
+                "language": "ta",
+                "segments": [],
+                "error": str(e),
+            }
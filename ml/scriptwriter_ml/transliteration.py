@@ -3,29 +3,21 @@
 from __future__ import annotations
 
 import logging
+import re
+import sys
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Iterable, List
+from typing import Iterator
 
-_logger = logging.getLogger(__name__)
-
-try:  # pragma: no cover - optional dependency
-    from indic_transliteration import sanscript
-    from indic_transliteration.sanscript import transliterate as indic_transliterate
-
-    _HAVE_INDIC = True
-except Exception:  # pragma: no cover - fallback path
-    _HAVE_INDIC = False
+from .deps import optional_import
 
-try:  # pragma: no cover - optional dependency
-    from tamil.utf8 import get_letters as _tamil_get_letters  # noqa: F401
-    from tamil.utf8.tanglish import tanglish_to_unicode
-
-    _HAVE_OPENTAMIL = True
-except Exception:  # pragma: no cover
-    _HAVE_OPENTAMIL = False
+_logger = logging.getLogger(__name__)
 
+# Kept small: the final merge deduplicates by linear scan
 MAX_CANDIDATES = 8
+# Inputs longer than this skip the offline transducer whenever
+# indic-transliteration succeeded
+FALLBACK_MAX_LENGTH = 40
 
 CONSONANT_MAP: dict[str, list[str]] = {
     "ksh": ["க்ஷ"],
@@ -122,6 +114,13 @@ SPECIAL_SEQ: dict[str, list[str]] = {
     "om": ["ஓம்"],
 }
 
+# Share one object per distinct Tamil string so the syllable tables below and
+# the transducer's dedup compare by identity first
+for _map in (CONSONANT_MAP, VOWEL_SIGN_MAP, PURE_VOWEL_MAP, SPECIAL_SEQ):
+    for _key, _values in _map.items():
+        _map[_key] = [sys.intern(value) for value in _values]
+del _map, _key, _values
+
 CONSONANT_KEYS = sorted(CONSONANT_MAP, key=len, reverse=True)
 VOWEL_KEYS = sorted(
     {key for key in (*VOWEL_SIGN_MAP.keys(), *PURE_VOWEL_MAP.keys()) if key},
@@ -130,6 +129,176 @@ VOWEL_KEYS = sorted(
 )
 
 
+def _apply_consonant_vowel(consonant_letters: list[str], vowel_key: str) -> list[str]:
+    vowel_key = vowel_key or ""
+    vowel_signs = VOWEL_SIGN_MAP.get(vowel_key, [""])
+    combinations: list[str] = []
+    for base in consonant_letters:
+        if not base:
+            continue
+        for sign in vowel_signs:
+            combinations.append(base + sign)
+    return combinations or list(consonant_letters)
+
+
+# Every consonant x vowel-sign syllable, folded once at import. "" is the
+# bare consonant (virama or inherent vowel).
+SYLLABLE_TABLE: dict[tuple[str, str], tuple[str, ...]] = {
+    (consonant_key, vowel_key): tuple(map(sys.intern, _apply_consonant_vowel(letters, vowel_key)))
+    for consonant_key, letters in CONSONANT_MAP.items()
+    for vowel_key in ("", *VOWEL_KEYS)
+}
+
+# Match kinds carried in key entries
+_SPECIAL = 0
+_VOWEL = 1
+_CONSONANT = 2
+
+# (key, key length, kind, letters or bare syllables, syllables by vowel key)
+_KeyEntry = tuple[str, int, int, tuple[str, ...], dict[str, tuple[str, ...]]]
+# Everything matching at one position: key entries in priority order, whether
+# a consonant key starts there, and the (vowel key, length) pairs that do
+_Matches = tuple[tuple[_KeyEntry, ...], bool, tuple[tuple[str, int], ...]]
+
+
+def _build_key_entries() -> list[_KeyEntry]:
+    """List every source key entry in matching priority order.
+
+    Special sequences come first, then pure vowels, then consonants, each in
+    the order the transducer has always tried them. Consonant entries carry
+    their syllables precombined with every vowel sign, shared from
+    SYLLABLE_TABLE.
+    """
+
+    entries: list[_KeyEntry] = []
+    for seq, tamil_seq in SPECIAL_SEQ.items():
+        entries.append((seq, len(seq), _SPECIAL, tuple(tamil_seq), {}))
+    for vowel in VOWEL_KEYS:
+        if vowel in PURE_VOWEL_MAP:
+            entries.append((vowel, len(vowel), _VOWEL, tuple(PURE_VOWEL_MAP[vowel]), {}))
+    for consonant_key in CONSONANT_KEYS:
+        if not consonant_key:
+            continue
+        variants = {
+            vowel_key: SYLLABLE_TABLE[(consonant_key, vowel_key)] for vowel_key in VOWEL_KEYS
+        }
+        bare = SYLLABLE_TABLE[(consonant_key, "")]
+        entries.append((consonant_key, len(consonant_key), _CONSONANT, bare, variants))
+    return entries
+
+
+class _DoubleArrayTrie:
+    """Double-array trie over lowercase ASCII keys.
+
+    A child of state ``s`` on letter code ``c`` lives at ``base[s] + c`` and is
+    valid only if ``check`` there points back at ``s``. ``value`` holds the key
+    id ending at a state, or -1.
+    """
+
+    __slots__ = ("base", "check", "value", "depth")
+
+    def __init__(self, keys: list[str]) -> None:
+        nodes: list[dict[int, int]] = [{}]
+        ends: dict[int, int] = {}
+        for key_id, key in enumerate(keys):
+            node = 0
+            for char in key:
+                code = ord(char) - 96
+                if code not in nodes[node]:
+                    nodes[node][code] = len(nodes)
+                    nodes.append({})
+                node = nodes[node][code]
+            ends[node] = key_id
+
+        base = [0]
+        check = [-2]
+        value = [ends.get(0, -1)]
+        states = {0: 0}
+        pending = [0]
+        while pending:
+            node = pending.pop(0)
+            children = sorted(nodes[node])
+            if not children:
+                continue
+            # First offset at which every child cell is free
+            offset = 1
+            while any(
+                offset + code < len(check) and check[offset + code] != -1 for code in children
+            ):
+                offset += 1
+            state = states[node]
+            base[state] = offset
+            for code in children:
+                cell = offset + code
+                while cell >= len(check):
+                    base.append(0)
+                    check.append(-1)
+                    value.append(-1)
+                child = nodes[node][code]
+                check[cell] = state
+                value[cell] = ends.get(child, -1)
+                states[child] = cell
+                pending.append(child)
+
+        # Pad so base[s] + code never indexes past the end
+        padding = max(base) + 27 - len(check)
+        self.base = base + [0] * padding
+        self.check = check + [-1] * padding
+        self.value = value + [-1] * padding
+        self.depth = max(map(len, keys))
+
+    def common_prefix_search(self, text: str, start: int) -> tuple[int, ...]:
+        """Return ids of every key that is a prefix of ``text[start:]``, shortest first."""
+
+        base, check, value = self.base, self.check, self.value
+        state = 0
+        found: list[int] = []
+        for j in range(start, min(len(text), start + self.depth)):
+            code = ord(text[j]) - 96
+            if code < 1 or code > 26:
+                break
+            cell = base[state] + code
+            if check[cell] != state:
+                break
+            state = cell
+            if value[state] >= 0:
+                found.append(value[state])
+        return tuple(found)
+
+
+_KEY_ENTRIES = _build_key_entries()
+_MATCH_KEYS = list(dict.fromkeys([entry[0] for entry in _KEY_ENTRIES] + VOWEL_KEYS))
+TRIE = _DoubleArrayTrie(_MATCH_KEYS)
+
+# Entries sharing a key, and each key's rank in priority order
+_ENTRIES_BY_KEY: dict[str, list[tuple[int, _KeyEntry]]] = {}
+for _rank, _entry in enumerate(_KEY_ENTRIES):
+    _ENTRIES_BY_KEY.setdefault(_entry[0], []).append((_rank, _entry))
+del _rank, _entry
+
+_CONSONANT_KEY_SET = frozenset(key for key in CONSONANT_KEYS if key)
+
+# _Matches per distinct set of key ids; few distinct sets occur in practice
+_MATCHES_BY_IDS: dict[tuple[int, ...], _Matches] = {}
+
+
+def _matches_for(key_ids: tuple[int, ...]) -> _Matches:
+    matches = _MATCHES_BY_IDS.get(key_ids)
+    if matches is None:
+        keys = [_MATCH_KEYS[key_id] for key_id in key_ids]
+        ranked = sorted(
+            (ranked_entry for key in keys for ranked_entry in _ENTRIES_BY_KEY.get(key, ())),
+            key=lambda ranked_entry: ranked_entry[0],
+        )
+        matches = (
+            tuple(entry for _, entry in ranked),
+            any(key in _CONSONANT_KEY_SET for key in keys),
+            tuple((key, len(key)) for key in VOWEL_KEYS if key in keys),
+        )
+        _MATCHES_BY_IDS[key_ids] = matches
+    return matches
+
+
 @dataclass
 class TransliterationResult:
     candidates: list[str]
@@ -144,149 +313,198 @@ def transliterate_tamil(text: str, scheme: str = "itrans") -> TransliterationRes
     if not cleaned:
         return TransliterationResult(candidates=[], engine="noop", notes=[])
 
-    suggestions: list[str] = []
-    notes: list[str] = []
+    # The cache holds immutable tuples; every caller gets fresh lists
+    candidates, engine, notes = _transliterate_cached(cleaned, scheme)
+    return TransliterationResult(candidates=list(candidates), engine=engine, notes=list(notes))
 
-    if _HAVE_INDIC:
-        try:
-            mapped = indic_transliterate(cleaned, scheme, sanscript.TAMIL)
-            suggestions.append(mapped)
-        except Exception as exc:  # pragma: no cover - log and continue
-            _logger.warning("indic-transliteration failed: %s", exc, exc_info=True)
-            notes.append("indic-transliteration failed; using fallbacks")
-    else:
-        notes.append("Install optional dependency 'indic-transliteration' for high quality output")
 
-    if _HAVE_OPENTAMIL:
-        try:
-            tamil_text = tanglish_to_unicode(cleaned)
-            suggestions.append(tamil_text)
-        except Exception as exc:  # pragma: no cover
-            _logger.warning("open-tamil transliteration failed: %s", exc, exc_info=True)
-            notes.append("open-tamil fallback failed")
+@lru_cache(maxsize=1024)
+def _transliterate_cached(
+    cleaned: str, scheme: str
+) -> tuple[tuple[str, ...], str, tuple[str, ...]]:
+    """Run the engine pipeline for stripped, non-empty ``cleaned`` text."""
 
-    fallback_candidates = _fallback_transliterate(cleaned)
-    suggestions.extend(fallback_candidates)
-
-    # Deduplicate while preserving order and limit to MAX_CANDIDATES
-    seen = set()
+    notes: list[str] = []
     ordered: list[str] = []
-    for candidate in suggestions:
-        if not candidate:
-            continue
-        if candidate not in seen:
-            seen.add(candidate)
-            ordered.append(candidate)
-        if len(ordered) >= MAX_CANDIDATES:
-            break
+
+    # Engines run in order and later ones are never started once the cap is
+    # reached
+    indic_ok = _merge_candidates(_indic_producer(cleaned, scheme, notes), ordered)
+    full = len(ordered) >= MAX_CANDIDATES
+    if not full:
+        _merge_candidates(_opentamil_producer(cleaned, notes), ordered)
+        full = len(ordered) >= MAX_CANDIDATES
+
+    # The offline transducer backs up the other engines and adds alternative
+    # spellings; once indic-transliteration has answered, skip it for long
+    # input where its combinatorial output helps least
+    skip_fallback = indic_ok and len(cleaned) > FALLBACK_MAX_LENGTH
+    if not full and not skip_fallback:
+        _merge_candidates(_fallback_transliterate(cleaned), ordered)
 
     if not ordered:
         ordered.append(cleaned)
 
-    return TransliterationResult(candidates=ordered, engine=_detect_engine(ordered), notes=notes)
-
-
-def _detect_engine(candidates: list[str]) -> str:
-    if not candidates:
-        return "fallback"
-    return "hybrid"
+    return tuple(ordered), _detect_engine(ordered), tuple(notes)
 
 
-def _fallback_transliterate(text: str) -> list[str]:
-    """Rule-based offline transliteration with multiple suggestions."""
-
-    outputs = _transduce(text.lower())
-    if not outputs:
-        return [text]
-    return outputs[:MAX_CANDIDATES]
+def _merge_candidates(candidates: Iterator[str], ordered: list[str]) -> bool:
+    """Append new non-empty ``candidates`` to ``ordered`` up to MAX_CANDIDATES.
 
+    Returns whether ``candidates`` yielded anything. ``ordered`` never exceeds
+    MAX_CANDIDATES, so a linear scan is cheaper than hashing into a set.
+    """
 
-@lru_cache(maxsize=4096)
-def _transduce(fragment: str) -> List[str]:
-    if not fragment:
-        return [""]
-
-    results: list[str] = []
+    produced = False
+    for candidate in candidates:
+        produced = True
+        if not candidate or candidate in ordered:
+            continue
+        ordered.append(candidate)
+        if len(ordered) >= MAX_CANDIDATES:
+            break
+    return produced
 
-    # Preserve whitespace
-    if fragment[0].isspace():
-        for tail in _transduce(fragment[1:]):
-            results.append(fragment[0] + tail)
-        return _limit(results)
 
-    # Preserve punctuation / numerals
-    if not fragment[0].isalpha():
-        for tail in _transduce(fragment[1:]):
-            results.append(fragment[0] + tail)
-        return _limit(results)
+def _indic_producer(text: str, scheme: str, notes: list[str]) -> Iterator[str]:
+    sanscript = optional_import("indic_transliteration.sanscript")
+    if sanscript is None:
+        notes.append("Install optional dependency 'indic-transliteration' for high quality output")
+        return
+    try:
+        tamil: str = sanscript.transliterate(text, scheme, sanscript.TAMIL)
+        yield tamil
+    except Exception as exc:  # pragma: no cover - log and continue
+        _logger.warning("indic-transliteration failed: %s", exc, exc_info=True)
+        notes.append("indic-transliteration failed; using fallbacks")
+
+
+def _opentamil_producer(text: str, notes: list[str]) -> Iterator[str]:
+    tanglish_to_unicode = optional_import("tamil.utf8.tanglish", "tanglish_to_unicode")
+    if tanglish_to_unicode is None:
+        return
+    try:
+        tamil: str = tanglish_to_unicode(text)
+        yield tamil
+    except Exception as exc:  # pragma: no cover
+        _logger.warning("open-tamil transliteration failed: %s", exc, exc_info=True)
+        notes.append("open-tamil fallback failed")
 
-    for seq, tamil_seq in SPECIAL_SEQ.items():
-        if fragment.startswith(seq):
-            for tamil in tamil_seq:
-                for tail in _transduce(fragment[len(seq) :]):
-                    results.append(tamil + tail)
 
-    for vowel in VOWEL_KEYS:
-        if fragment.startswith(vowel) and vowel in PURE_VOWEL_MAP:
-            for letter in PURE_VOWEL_MAP[vowel]:
-                for tail in _transduce(fragment[len(vowel) :]):
-                    results.append(letter + tail)
+def _detect_engine(candidates: list[str]) -> str:
+    if not candidates:
+        return "fallback"
+    return "hybrid"
 
-    for consonant_key in CONSONANT_KEYS:
-        if not consonant_key:
-            continue
-        if not fragment.startswith(consonant_key):
-            continue
 
-        remaining_index = len(consonant_key)
-        consonant_letters = CONSONANT_MAP.get(consonant_key, [""])
-
-        # Try vowels (including empty for pure consonant)
-        vowel_candidates = [""] + VOWEL_KEYS
-        for vowel_key in vowel_candidates:
-            if vowel_key:
-                if not fragment.startswith(vowel_key, remaining_index):
-                    continue
-                consumed = remaining_index + len(vowel_key)
-            else:
-                consumed = remaining_index
-                # Pure consonant only if we have another consonant or boundary
-                if consumed < len(fragment):
-                    next_char = fragment[consumed]
-                    if next_char.isalpha():
-                        if not any(
-                            key and fragment.startswith(key, consumed)
-                            for key in CONSONANT_KEYS
-                        ):
-                            continue
-
-            syllables = _apply_consonant_vowel(consonant_letters, vowel_key)
-            for syllable in syllables:
-                for tail in _transduce(fragment[consumed:]):
-                    results.append(syllable + tail)
+# Alternating runs of transliterable letters and passthrough characters
+_SEGMENT_RE = re.compile(r"[a-z]+|[^a-z]+")
 
-    return _limit(results)
 
+def _fallback_transliterate(text: str) -> Iterator[str]:
+    """Rule-based offline transliteration with multiple suggestions."""
 
-def _apply_consonant_vowel(consonant_letters: Iterable[str], vowel_key: str) -> list[str]:
-    vowel_key = vowel_key or ""
-    vowel_signs = VOWEL_SIGN_MAP.get(vowel_key, [""])
-    combinations: list[str] = []
-    for base in consonant_letters:
-        if not base:
+    outputs = _transduce_text(text.lower())
+    if not outputs:
+        yield text
+        return
+    yield from outputs[:MAX_CANDIDATES]
+
+
+def _transduce_text(text: str) -> list[str]:
+    """Enumerate Tamil spellings of lowercased ``text``, up to MAX_CANDIDATES.
+
+    Letter runs are spelled independently by _transduce_run; everything in
+    between (whitespace, punctuation, numerals) is copied through verbatim.
+    A letter with no romanisation key, such as a non-ASCII letter, leaves
+    no spelling at all.
+    """
+
+    segments: list[str] = _SEGMENT_RE.findall(text)
+    tails = [""]
+    for segment in reversed(segments):
+        if "a" <= segment[0] <= "z":
+            spellings = _transduce_run(segment)
+            if tails == [""]:
+                tails = list(spellings)
+                continue
+            # Spellings hold only Tamil and each tail starts with a
+            # passthrough character, so every pair is distinct
+            per_spelling = -(-MAX_CANDIDATES // len(tails))
+            tails = [
+                spelling + tail for spelling in spellings[:per_spelling] for tail in tails
+            ][:MAX_CANDIDATES]
+        elif not segment.isascii() and any(char.isalpha() for char in segment):
+            return []
+        else:
+            tails = [segment + tail for tail in tails]
+    return tails
+
+
+@lru_cache(maxsize=512)
+def _transduce_run(text: str) -> tuple[str, ...]:
+    """Spell a run of ``a``-``z`` letters by dynamic programming over suffixes.
+
+    ``cands[i]`` holds up to MAX_CANDIDATES spellings of ``text[i:]``. Positions
+    are filled right to left, so every prefix match reuses the already-limited
+    list for the suffix it leaves behind instead of re-exploring it. Runs are
+    cached by word, so a word that recurs across different inputs is only
+    spelled once.
+    """
+
+    n = len(text)
+    cands: list[list[str]] = [[] for _ in range(n + 1)]
+    cands[n] = [""]
+
+    # One trie walk per position serves both the keys starting there and the
+    # vowel and consonant lookahead of keys ending there
+    matches = [_matches_for(TRIE.common_prefix_search(text, i)) for i in range(n + 1)]
+
+    for i in range(n - 1, -1, -1):
+        cands[i] = _spell_at(i, cands, matches)
+
+    return tuple(cands[0])
+
+
+def _spell_at(i: int, cands: list[list[str]], matches: list[_Matches]) -> list[str]:
+    """Spell the run from ``i`` from every key matching at ``i`` and the suffix lists.
+
+    Candidates are deduplicated in insertion order and generation stops as
+    soon as MAX_CANDIDATES distinct spellings exist.
+    """
+
+    n = len(cands) - 1
+    dedup: dict[str, None] = {}
+
+    for _key, size, kind, syllables, variants in matches[i][0]:
+        end = i + size
+
+        if kind != _CONSONANT:
+            tails = cands[end]
+            for letter in syllables:
+                for tail in tails:
+                    dedup[letter + tail] = None
+                    if len(dedup) >= MAX_CANDIDATES:
+                        return list(dedup)
             continue
-        for sign in vowel_signs:
-            combinations.append(base + sign)
-    return combinations or list(consonant_letters)
 
+        _, consonant_follows, vowels_follow = matches[end]
 
-def _limit(candidates: Iterable[str]) -> list[str]:
-    seen = set()
-    ordered: list[str] = []
-    for candidate in candidates:
-        if candidate not in seen:
-            seen.add(candidate)
-            ordered.append(candidate)
-        if len(ordered) >= MAX_CANDIDATES:
-            break
-    return ordered
+        # Pure consonant only if we have another consonant or boundary
+        if end >= n or consonant_follows:
+            tails = cands[end]
+            for syllable in syllables:
+                for tail in tails:
+                    dedup[syllable + tail] = None
+                    if len(dedup) >= MAX_CANDIDATES:
+                        return list(dedup)
+
+        for vowel_key, vowel_size in vowels_follow:
+            tails = cands[end + vowel_size]
+            for syllable in variants[vowel_key]:
+                for tail in tails:
+                    dedup[syllable + tail] = None
+                    if len(dedup) >= MAX_CANDIDATES:
+                        return list(dedup)
+
+    return list(dedup)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, TypeVar, cast
 
 from .models import ensure_directories, locate_model
 
 _logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Try to import pyttsx3 for offline TTS
 try:
     import pyttsx3
@@ -18,6 +24,146 @@ except ImportError:
     _HAVE_PYTTSX3 = False
     _logger.warning("pyttsx3 not installed. Install with: pip install pyttsx3")
 
+# Voice each engine started with, restored when no language-specific voice applies
+_DEFAULT_VOICES: dict[str | None, str] = {}
+
+# pyttsx3 drivers (SAPI5 COM objects, NSSpeechSynthesizer) are bound to the
+# thread that created them, so one long-lived worker thread creates the engine
+# and runs every job against it.
+_TTS_QUEUE: queue.Queue = queue.Queue()
+_TTS_THREAD: threading.Thread | None = None
+_TTS_THREAD_LOCK = threading.Lock()
+_STOP = object()
+
+# Guards job states and _TTS_WEDGED, which is set while a job that overran its
+# caller's timeout is still running in the driver
+_TTS_COND = threading.Condition()
+_TTS_WEDGED = False
+
+# Seconds a caller waits for a job, plus an allowance per character of text
+_TTS_TIMEOUT = 30.0
+_TTS_TIMEOUT_PER_CHAR = 0.2
+
+
+@lru_cache(maxsize=4)
+def _get_engine(driver: str | None = None) -> "pyttsx3.Engine":
+    """Return a shared pyttsx3 engine; initialising a driver is slow."""
+    engine = pyttsx3.init(driver)
+    _DEFAULT_VOICES[driver] = engine.getProperty('voice')
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _voice_registry() -> dict[str, str]:
+    """Map language tags to installed voice ids, scanning the voice list once.
+
+    ``'ta'`` is the first Tamil voice and ``'en-IN'`` the first Indian English
+    voice; tags without a matching voice are absent.
+    """
+    registry: dict[str, str] = {}
+    for voice in _get_engine().getProperty('voices'):
+        voice_id = voice.id.lower()
+        voice_name = voice.name.lower() if hasattr(voice, 'name') else ''
+        # Look for Tamil voices (common patterns on macOS)
+        if 'tamil' in voice_id or 'tamil' in voice_name or 'ta_in' in voice_id:
+            registry.setdefault('ta', voice.id)
+        elif 'india' in voice_id or 'in_in' in voice_id:
+            registry.setdefault('en-IN', voice.id)
+    return registry
+
+
+class _Job:
+    """A unit of engine work; ``state`` is guarded by ``_TTS_COND``."""
+
+    __slots__ = ("fn", "state", "result", "error")
+
+    def __init__(self, fn: Callable[["pyttsx3.Engine"], object]) -> None:
+        self.fn = fn
+        # "queued" -> "running" -> "done", or "cancelled" before it runs
+        self.state = "queued"
+        self.result: object = None
+        self.error: Exception | None = None
+
+
+def _tts_worker() -> None:
+    """Run queued jobs one at a time against the engine owned by this thread."""
+    global _TTS_WEDGED
+    while True:
+        job = _TTS_QUEUE.get()
+        if job is _STOP:
+            break
+        with _TTS_COND:
+            if job.state == "cancelled":
+                continue
+            job.state = "running"
+            _TTS_COND.notify_all()
+        try:
+            job.result = job.fn(_get_engine())
+        except Exception as e:
+            job.error = e
+        with _TTS_COND:
+            job.state = "done"
+            # Whatever overran has finished, so the engine is free again
+            _TTS_WEDGED = False
+            _TTS_COND.notify_all()
+
+
+def _run_on_worker(fn: Callable[["pyttsx3.Engine"], _T], text_length: int = 0) -> _T:
+    """Run ``fn(engine)`` on the TTS worker thread and return its result.
+
+    Exceptions raised by ``fn`` are re-raised here. The timeout starts when
+    the job begins running; if it expires, TimeoutError is raised and the
+    engine counts as busy until the driver returns. While it is busy, queued
+    jobs are cancelled instead of running late and new calls fail at once, so
+    a call that reported failure never speaks or writes files afterwards.
+    """
+    global _TTS_WEDGED
+    _ensure_tts_worker()
+    job = _Job(fn)
+    timeout = _TTS_TIMEOUT + _TTS_TIMEOUT_PER_CHAR * text_length
+    with _TTS_COND:
+        if _TTS_WEDGED:
+            raise TimeoutError("TTS engine is still busy with a job that timed out")
+        _TTS_QUEUE.put(job)
+        try:
+            _TTS_COND.wait_for(lambda: job.state != "queued" or _TTS_WEDGED)
+            if job.state == "queued":
+                raise TimeoutError("TTS engine is still busy with a job that timed out")
+            if not _TTS_COND.wait_for(lambda: job.state == "done", timeout):
+                raise TimeoutError(f"TTS engine did not finish within {timeout:.0f}s")
+        finally:
+            if job.state == "queued":
+                job.state = "cancelled"
+            elif job.state == "running":
+                _TTS_WEDGED = True
+                _TTS_COND.notify_all()
+    if job.error is not None:
+        raise job.error
+    return cast(_T, job.result)
+
+
+def _ensure_tts_worker() -> None:
+    global _TTS_THREAD
+    with _TTS_THREAD_LOCK:
+        if _TTS_THREAD is None or not _TTS_THREAD.is_alive():
+            _TTS_THREAD = threading.Thread(target=_tts_worker, name="tts-worker", daemon=True)
+            _TTS_THREAD.start()
+
+
+@atexit.register
+def _stop_tts_worker() -> None:
+    thread = _TTS_THREAD
+    if thread is not None and thread.is_alive():
+        _TTS_QUEUE.put(_STOP)
+        thread.join(timeout=5)
+
+
+def _apply_file_settings(engine: "pyttsx3.Engine") -> None:
+    """Reset voice, rate and volume left behind by earlier jobs for file output."""
+    engine.setProperty('voice', _DEFAULT_VOICES[None])
+    engine.setProperty('rate', 150)
+    engine.setProperty('volume', 0.9)
+
 
 def synthesize_to_file(text: str, output_path: str, language: str = "en") -> dict:
     """
@@ -37,12 +183,13 @@ def synthesize_to_file(text: str, output_path: str, language: str = "en") -> dic
             "error": "pyttsx3 not installed. Run: pip install pyttsx3"
         }
     
-    try:
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 150)
-        engine.setProperty('volume', 0.9)
+    def save(engine: "pyttsx3.Engine") -> None:
+        _apply_file_settings(engine)
         engine.save_to_file(text, output_path)
         engine.runAndWait()
+    
+    try:
+        _run_on_worker(save, len(text))
         
         return {
             "success": True,
@@ -51,7 +198,7 @@ def synthesize_to_file(text: str, output_path: str, language: str = "en") -> dic
         }
         
     except Exception as e:
-        _logger.error(f"TTS synthesis error: {e}")
+        _logger.error("TTS synthesis error: %s", e)
         return {
             "success": False,
             "error": str(e)
@@ -75,45 +222,35 @@ def speak_text(text: str, language: str = "en") -> dict:
             "error": "pyttsx3 not installed. Run: pip install pyttsx3"
         }
     
-    try:
-        engine = pyttsx3.init()
-        
+    def speak(engine: "pyttsx3.Engine") -> None:
         # Configure for Tamil if needed
+        voice_id = None
         if language == 'ta' or language.startswith('ta'):
-            # Try to find a Tamil voice
-            voices = engine.getProperty('voices')
-            tamil_voice = None
-            
-            # Look for Tamil voices (common patterns on macOS)
-            for voice in voices:
-                voice_id = voice.id.lower()
-                voice_name = voice.name.lower() if hasattr(voice, 'name') else ''
-                if 'tamil' in voice_id or 'tamil' in voice_name or 'ta_in' in voice_id:
-                    tamil_voice = voice.id
-                    _logger.info(f"Using Tamil voice: {tamil_voice}")
-                    break
-            
-            if tamil_voice:
-                engine.setProperty('voice', tamil_voice)
+            registry = _voice_registry()
+            voice_id = registry.get('ta')
+            if voice_id:
+                _logger.info("Using Tamil voice: %s", voice_id)
             else:
-                # If no Tamil voice found, try Indian English or default
-                for voice in voices:
-                    voice_id = voice.id.lower()
-                    if 'india' in voice_id or 'in_in' in voice_id:
-                        engine.setProperty('voice', voice.id)
-                        _logger.info(f"Using Indian voice: {voice.id}")
-                        break
                 _logger.warning("No Tamil voice found. Download from: System Settings → Accessibility → Spoken Content → System Voices")
+                # If no Tamil voice found, try Indian English or default
+                voice_id = registry.get('en-IN')
+                if voice_id:
+                    _logger.info("Using Indian voice: %s", voice_id)
+        engine.setProperty('voice', voice_id or _DEFAULT_VOICES[None])
         
         # Set properties
         engine.setProperty('rate', 140)  # Slower for Tamil
         engine.setProperty('volume', 0.9)
         
         # Speak the text
-        _logger.info(f"Speaking text (length={len(text)}, language={language})")
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info("Speaking text (length=%d, language=%s)", len(text), language)
         engine.say(text)
         engine.runAndWait()
         _logger.info("Speech completed")
+    
+    try:
+        _run_on_worker(speak, len(text))
         
         return {
             "success": True,
@@ -122,7 +259,7 @@ def speak_text(text: str, language: str = "en") -> dict:
         }
         
     except Exception as e:
-        _logger.error(f"TTS speech error: {e}")
+        _logger.error("TTS speech error: %s", e)
         return {
             "success": False,
             "error": str(e)
@@ -137,28 +274,47 @@ def synthesise(
 ) -> list[dict]:
     """Placeholder TTS generation with pyttsx3 fallback.
 
+    Each line is written to ``preview_<index>.wav`` next to the model artifact
+    by the TTS worker thread; the call returns once every line is done, or
+    with an error on every result if the engine fails or times out.
     Hook in Coqui XTTS or eSpeak in the future.
     """
 
     ensure_directories(root, identifiers=[model_id])
     artifact = locate_model(model_id, root=root)
     
+    lines = list(lines)
+    out_dir = Path(artifact).parent
+    out_paths = [(line, str(out_dir / f"preview_{i}.wav")) for i, line in enumerate(lines)]
+    error = None
+    
+    def render(engine: "pyttsx3.Engine") -> None:
+        # Queue every line, then flush them all in one driver round-trip
+        _apply_file_settings(engine)
+        for line, path in out_paths:
+            engine.save_to_file(line, path)
+        engine.runAndWait()
+    
+    if _HAVE_PYTTSX3:
+        try:
+            _run_on_worker(render, sum(len(line) for line in lines))
+        except Exception as e:
+            _logger.error("Batch TTS failed: %s", e)
+            error = str(e)
+    else:
+        error = "No TTS engine available"
+    
     results = []
-    for line in lines:
-        # Use fallback TTS if available
-        if _HAVE_PYTTSX3:
-            results.append({
-                "text": line,
-                "audio_path": str((Path(artifact).parent / "preview.wav")),
-                "speaker": speaker or "default",
-                "engine": "pyttsx3"
-            })
+    for line, path in out_paths:
+        result = {
+            "text": line,
+            "audio_path": path,
+            "speaker": speaker or "default",
+        }
+        if error is None:
+            result["engine"] = "pyttsx3"
         else:
-            results.append({
-                "text": line,
-                "audio_path": str((Path(artifact).parent / "preview.wav")),
-                "speaker": speaker or "default",
-                "error": "No TTS engine available"
-            })
+            result["error"] = error
+        results.append(result)
     
     return results
@@ -0,0 +1,119 @@
+"""Tests for the CLI's JSON and NDJSON output, which the Tauri side parses."""
+
+import io
+import json
+
+import pytest
+
+from scriptwriter_ml import cli
+from scriptwriter_ml.llm import PromptResult
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib encoder."""
+    if request.param and not cli._HAVE_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(cli, "_HAVE_ORJSON", request.param)
+
+
+def _failing_stream(items, message="boom"):
+    yield from items
+    raise RuntimeError(message)
+
+
+def _write(writer, data):
+    out = io.BytesIO()
+    writer(data, out)
+    return out.getvalue()
+
+
+def test_write_json_plain_value(encoder):
+    data = {"candidates": ["வணக்கம்"], "engine": "hybrid", "notes": []}
+    assert json.loads(_write(cli._write_json, data)) == data
+
+
+def test_write_json_streams_list_inside_envelope(encoder):
+    records = [{"identifier": "a"}, {"identifier": "b"}]
+    data = {"models": cli._StreamList(iter(records)), "root": "/tmp"}
+    assert json.loads(_write(cli._write_json, data)) == {"models": records, "root": "/tmp"}
+
+
+def test_write_json_closes_failing_stream_with_error_record(encoder):
+    out = io.BytesIO()
+    data = {"results": cli._StreamList(_failing_stream([{"file": "a.wav"}]))}
+    with pytest.raises(RuntimeError, match="boom"):
+        cli._write_json(data, out)
+    assert json.loads(out.getvalue()) == {"results": [{"file": "a.wav"}, {"error": "boom"}]}
+
+
+def test_write_json_failing_stream_before_first_item(encoder):
+    out = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        cli._write_json(cli._StreamList(_failing_stream([])), out)
+    assert json.loads(out.getvalue()) == [{"error": "boom"}]
+
+
+def test_write_json_unencodable_item_leaves_no_partial_record(encoder):
+    out = io.BytesIO()
+    with pytest.raises(TypeError):
+        cli._write_json(cli._StreamList(iter([{"ok": 1}, {"bad": object()}])), out)
+    records = json.loads(out.getvalue())
+    assert records[0] == {"ok": 1}
+    assert set(records[1]) == {"error"}
+
+
+def test_write_ndjson_unwraps_single_collection_envelope(encoder):
+    records = [{"identifier": "a"}, {"identifier": "b"}]
+    for data in ({"models": cli._StreamList(iter(records))}, {"models": records}, records):
+        lines = _write(cli._write_ndjson, data).splitlines()
+        assert [json.loads(line) for line in lines] == records
+
+
+def test_write_ndjson_keeps_other_values_on_one_line(encoder):
+    data = {"success": True, "path": "/tmp/out.wav"}
+    assert _write(cli._write_ndjson, data).count(b"\n") == 1
+    assert json.loads(_write(cli._write_ndjson, data)) == data
+    raw = cli._RawJSON(b'{"a":1}')
+    assert _write(cli._write_ndjson, raw) == b'{"a":1}\n'
+
+
+def test_write_ndjson_ends_failing_stream_with_error_line(encoder):
+    out = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        cli._write_ndjson({"results": cli._StreamList(_failing_stream([{"file": "a.wav"}]))}, out)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines == [{"file": "a.wav"}, {"error": "boom"}]
+
+
+def test_main_ndjson_models(tmp_path, capsysbinary):
+    cli.main(["--ndjson", "models", "--root", str(tmp_path)])
+    lines = capsysbinary.readouterr().out.splitlines()
+    records = [json.loads(line) for line in lines]
+    assert records and all("identifier" in record for record in records)
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        PromptResult(prompt="a \"quoted\"\nprompt", response="வணக்கம்\t ", model_id="m"),
+        PromptResult(prompt="p", response="", model_id="m", error="No API key"),
+        PromptResult(prompt="p", response="partial", model_id="m", error="HTTP 500"),
+    ],
+)
+def test_llm_generate_envelope_matches_dict_output(result, encoder, monkeypatch):
+    import scriptwriter_ml.llm as llm
+
+    monkeypatch.setattr(cli, "probe_once", lambda name: True)
+    monkeypatch.setattr(llm, "draft_scene", lambda **kwargs: result)
+    args = cli.build_parser().parse_args(["llm-generate", "--prompt", result.prompt])
+    expected = {
+        "prompt": result.prompt,
+        "response": result.response,
+        "model_id": result.model_id,
+        "success": bool(result.response) and result.error is None,
+        "error": result.error,
+    }
+    encoded = _write(cli._write_json, cli._llm_generate_command(args))
+    assert list(json.loads(encoded).items()) == list(expected.items())
+    assert encoded == cli._dumps(expected)
@@ -0,0 +1,103 @@
+"""Tests for the LLM helpers that parse model headers and streamed responses."""
+
+import json
+import struct
+
+import pytest
+
+from scriptwriter_ml import llm
+
+
+def _gguf_string(value):
+    encoded = value.encode("utf-8")
+    return struct.pack("<Q", len(encoded)) + encoded
+
+
+def _gguf_kv(key, value_type, payload):
+    return _gguf_string(key) + struct.pack("<I", value_type) + payload
+
+
+def _write_gguf(path, entries, version=3, padding=0):
+    header = b"GGUF" + struct.pack("<IQQ", version, 0, len(entries)) + b"".join(entries)
+    path.write_bytes(header + b"\0" * padding)
+    return str(path)
+
+
+def test_gguf_block_count_skips_preceding_metadata(tmp_path):
+    path = _write_gguf(tmp_path / "model.gguf", [
+        _gguf_kv("general.architecture", 8, _gguf_string("llama")),
+        # uint32 array, then an array of strings
+        _gguf_kv("general.ids", 9, struct.pack("<IQ", 4, 3) + struct.pack("<3I", 1, 2, 3)),
+        _gguf_kv("tokenizer.tokens", 9, struct.pack("<IQ", 8, 2) + _gguf_string("a") + _gguf_string("bc")),
+        _gguf_kv("general.score", 6, struct.pack("<f", 0.5)),
+        _gguf_kv("llama.block_count", 4, struct.pack("<I", 32)),
+    ])
+    assert llm._gguf_block_count(path) == 32
+
+
+def test_gguf_block_count_reads_64_bit_values(tmp_path):
+    path = _write_gguf(tmp_path / "model.gguf", [_gguf_kv("phi2.block_count", 10, struct.pack("<Q", 40))])
+    assert llm._gguf_block_count(path) == 40
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not a gguf file",
+        b"GGUF" + struct.pack("<I", 1),  # v1 headers use 32-bit counts
+        b"GGUF" + struct.pack("<IQQ", 3, 0, 1) + _gguf_string("llama.block"),  # truncated
+    ],
+    ids=["not-gguf", "v1", "truncated"],
+)
+def test_gguf_block_count_unreadable_header(tmp_path, content):
+    path = tmp_path / "model.gguf"
+    path.write_bytes(content)
+    assert llm._gguf_block_count(str(path)) is None
+
+
+def test_gguf_block_count_missing_key(tmp_path):
+    path = _write_gguf(tmp_path / "model.gguf", [_gguf_kv("general.architecture", 8, _gguf_string("llama"))])
+    assert llm._gguf_block_count(path) is None
+
+
+@pytest.mark.parametrize(("free_bytes", "expected"), [(None, -1), (10**12, -1), (6_100_000, 8), (1000, 0)])
+def test_auto_n_gpu_layers_sizes_from_free_memory(tmp_path, monkeypatch, free_bytes, expected):
+    # 16 layers in a 10 MB file: each layer needs 0.75 MB with 20% headroom
+    path = _write_gguf(
+        tmp_path / f"model-{free_bytes}.gguf",
+        [_gguf_kv("llama.block_count", 4, struct.pack("<I", 16))],
+        padding=10**7,
+    )
+    monkeypatch.setattr(llm.sys, "platform", "linux")
+    monkeypatch.setattr(llm, "_cuda_free_bytes", lambda: free_bytes)
+    assert llm._auto_n_gpu_layers(path) == expected
+
+
+def _sse(*events):
+    return [f"data: {json.dumps(event)}\n".encode() for event in events]
+
+
+def _content(text):
+    return {"choices": [{"delta": {"content": text}}]}
+
+
+def test_sse_deltas_yields_content_until_done():
+    lines = [
+        b": OPENROUTER PROCESSING\n",
+        b"\n",
+        *_sse({"choices": [{"delta": {"role": "assistant"}}]}, _content("Hel"), _content("lo")),
+        b"data: [DONE]\n",
+        *_sse(_content("ignored")),
+    ]
+    assert list(llm._sse_deltas(lines)) == ["Hel", "lo"]
+
+
+def test_sse_deltas_skips_usage_only_chunk():
+    lines = _sse(_content("done"), {"choices": [], "usage": {"total_tokens": 3}}, {"usage": {}})
+    assert list(llm._sse_deltas(lines)) == ["done"]
+
+
+@pytest.mark.parametrize("error", ["rate limited", {"message": "rate limited", "code": 429}])
+def test_sse_deltas_raises_on_error_chunk(error):
+    with pytest.raises(RuntimeError, match="rate limited"):
+        list(llm._sse_deltas(_sse(_content("a"), {"error": error})))
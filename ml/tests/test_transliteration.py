@@ -0,0 +1,22 @@
+"""Regression test for the romanised Tamil fallback transducer.
+
+``tests/data/transliteration_corpus.json`` holds ``[input, candidates]`` pairs
+recorded from the original per-position implementation; the table-driven
+transducer must reproduce them exactly, including candidate order.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scriptwriter_ml.transliteration import _fallback_transliterate
+
+_CORPUS = json.loads(
+    (Path(__file__).parent / "data" / "transliteration_corpus.json").read_text(encoding="utf-8")
+)
+
+
+@pytest.mark.parametrize(("text", "expected"), _CORPUS, ids=[repr(text) for text, _ in _CORPUS])
+def test_fallback_matches_recorded_output(text, expected):
+    assert list(_fallback_transliterate(text.strip())) == expected